@@ -2,55 +2,104 @@
 
 from __future__ import annotations
 
-from contextlib import AsyncExitStack
-from typing import Any
+import asyncio
+from collections.abc import Awaitable
+from typing import Any, Callable
 
-from exit_stack_container.container.helpers import make_cleanup
-
-from ..defaults import CLEANUP_ATTR_NAME
 from ..exceptions import ContainerReuseError
-from ..types import ResolvedDeps
+from ..types import AsyncCleanupFn, CleanupGetter
 from .container import AbstractContainer
+from .helpers import make_cleanup, make_resolution_levels
+
+type DependencyResolver = Callable[[list[Any]], Awaitable[Any]]
+type EnterStep = tuple[int, DependencyResolver, CleanupGetter | None]
+type EnterPlan = list[list[EnterStep]]
+
+_NO_CLEANUPS: list[AsyncCleanupFn] = []
+"""Shared empty cleanup list for containers without cleanups, keeps the reuse check working."""
 
 
 class AsyncExitStackContainer[T, V](AbstractContainer[T, V]):
-    """Async container managing resource lifecycle with AsyncExitStack"""
+    """Async container managing resource lifecycle with an exit-stack cleanup list"""
 
     _settings: T
-    _stack: AsyncExitStack | None = None
+    _cleanups: list[AsyncCleanupFn] | None = None
+
+    __plan__: EnterPlan = []
+    __plan_size__: int = 0
+    __has_cleanups__: bool = False
+    __resource_fields__: tuple[tuple[str, int], ...] = ()
+    __resources_use_dict__: bool | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Precompute the enter sequence once per subclass."""
+        super().__init_subclass__(**kwargs)
+        index = {name: position for position, name in enumerate(cls.__resolution_order__)}
+        cls.__plan__ = [
+            [
+                (index[name], dependency._make_resolver(index), dependency._cleanup_getter)
+                for name, dependency in ((name, cls.__dependencies__[name]) for name in level)
+            ]
+            for level in make_resolution_levels(cls.__dependencies__, cls.__resolution_order__)
+        ]
+        cls.__plan_size__ = len(index)
+        cls.__has_cleanups__ = any(cleanup_getter is not None for level in cls.__plan__ for _, _, cleanup_getter in level)
+        cls.__resource_fields__ = ()
+        cls.__resources_use_dict__ = None
 
     async def __aenter__(self) -> V:
-        if self._stack:
+        if self._cleanups is not None:
             raise ContainerReuseError("Container already entered, create new instance or exit first")
 
-        self._stack = AsyncExitStack()
+        self._cleanups = [] if self.__has_cleanups__ else _NO_CLEANUPS
+
+        resolved: list[Any] = [None] * self.__plan_size__
 
-        resolved: ResolvedDeps = {}
+        for level in self.__plan__:
+            if len(level) == 1:
+                instances = [await level[0][1](resolved)]
+            else:
+                instances = await asyncio.gather(*(resolver(resolved) for _, resolver, _ in level))
 
-        for name in self.resolution_order:
-            dependency = self.dependencies[name]
-            instance = await dependency.resolve(resolved)
-            resolved[name] = instance
+            for (position, _, cleanup_getter), instance in zip(level, instances):
+                resolved[position] = instance
 
-            if hasattr(dependency.factory, CLEANUP_ATTR_NAME):
-                cleanup_getter = getattr(dependency.factory, CLEANUP_ATTR_NAME)
-                cleanup = make_cleanup(cleanup_getter(instance))
-                self._stack.push_async_callback(cleanup)
+                if cleanup_getter is not None:
+                    self._cleanups.append(make_cleanup(cleanup_getter(instance)))
 
-        resources = self.resources_class()
-        setattr(resources, "settings", self._settings)
+        cls = type(self)
+        resources_class = self.resources_class
+        if cls.__dict__.get("__resources_use_dict__") is None:
+            annotations = getattr(resources_class, "__annotations__", {})
+            order = cls.__resolution_order__
+            cls.__resource_fields__ = tuple((name, position) for position, name in enumerate(order) if name in annotations)
+            cls.__resources_use_dict__ = not any("__slots__" in base.__dict__ for base in resources_class.__mro__)
 
-        annotations = getattr(self.resources_class, "__annotations__", {})
-        for name, instance in resolved.items():
-            if name not in annotations:
-                continue
-            setattr(resources, name, instance)
+        resources = resources_class()
+        if cls.__resources_use_dict__:
+            resources.__dict__["settings"] = self._settings
+            resources.__dict__.update((name, resolved[position]) for name, position in cls.__resource_fields__)
+        else:
+            setattr(resources, "settings", self._settings)
+            for name, position in cls.__resource_fields__:
+                setattr(resources, name, resolved[position])
 
-        await self._stack.__aenter__()
         return resources
 
     async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
-        """Exit context and cleanup all resources."""
-        if self._stack:
-            await self._stack.__aexit__(exc_type, exc_val, exc_tb)
-            self._stack = None
+        """Exit context and cleanup all resources in reverse order."""
+        cleanups, self._cleanups = self._cleanups, None
+        if not cleanups:
+            return
+
+        errors: list[BaseException] = []
+        for cleanup in reversed(cleanups):
+            try:
+                await cleanup()
+            except BaseException as exc:
+                errors.append(exc)
+
+        if errors:
+            if len(errors) == 1:
+                raise errors[0]
+            raise BaseExceptionGroup("cleanup errors", errors)
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 from abc import ABC
+from typing import Any
 
 from msgspec_settings import BaseSettings
 
-from exit_stack_container.container.helpers import extract_origin, extract_origin_base, make_resolution_order
-
 from ..dependency import Dependency
-from ..exceptions import InvalidContainerInheritance
+from ..exceptions import CircularDependencyError, InvalidContainerInheritance
 from ..models import BaseResources
+from .helpers import extract_origin, extract_origin_base, make_resolution_order
 
 
 class AbstractContainer[T = BaseSettings, V = BaseResources](ABC):
@@ -18,32 +18,42 @@ class AbstractContainer[T = BaseSettings, V = BaseResources](ABC):
 
     _settings: T
 
-    def __init__(self) -> None:
-        """Initialize container."""
-        self._resources_class: type[V] | None = None
-        self._dependencies: dict[str, Dependency] = {}
-        self._resolution_order: list[str] = []
+    __dependencies__: dict[str, Dependency] = {}
+    __resolution_order__: list[str] = []
+    __resources_class__: type | None = None
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        """Scan and cache dependency metadata once per subclass."""
+        super().__init_subclass__(**kwargs)
+        dependencies: dict[str, Dependency] = {}
+        for base in reversed(cls.__mro__):
+            for name, attr in base.__dict__.items():
+                if isinstance(attr, Dependency):
+                    dependencies[name] = attr
+        cls.__dependencies__ = dependencies
+        try:
+            cls.__resolution_order__ = make_resolution_order(cls.__dependencies__)
+        except CircularDependencyError as exc:
+            raise CircularDependencyError(f"{cls.__name__}: {exc}") from None
+        cls.__resources_class__ = None
 
     @property
     def resources_class(self) -> type[V]:
         """Resources class extracted from generic parameters."""
-        if self._resources_class is None:
-            self._resources_class = self._extract_resources_class()
-        return self._resources_class
+        cls = type(self)
+        if cls.__resources_class__ is None:
+            cls.__resources_class__ = self._extract_resources_class()
+        return cls.__resources_class__
 
     @property
     def dependencies(self) -> dict[str, Dependency]:
         """Scanned dependency descriptors."""
-        if not self._dependencies:
-            self._dependencies = self._scan_dependencies()
-        return self._dependencies
+        return self.__dependencies__
 
     @property
     def resolution_order(self) -> list[str]:
         """Topologically sorted dependency names."""
-        if not self._resolution_order:
-            self._resolution_order = make_resolution_order(self.dependencies)
-        return self._resolution_order
+        return self.__resolution_order__
 
     def _extract_resources_class(self) -> type[V[T]]:
         """Extract Resources class from second generic argument."""
@@ -59,11 +69,3 @@ class AbstractContainer[T = BaseSettings, V = BaseResources](ABC):
                 if issubclass(resources_cls, BaseResources):
                     return resources_cls
         raise InvalidContainerInheritance(f"{self.__class__.__name__} requires Resources subclass as second generic parameter")
-
-    def _scan_dependencies(self) -> dict[str, Dependency]:
-        """Scan container class for Dependency descriptors."""
-        dependencies = {}
-        for name, attr in vars(self.__class__).items():
-            if isinstance(attr, Dependency):
-                dependencies[name] = attr
-        return dependencies
@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import inspect
-from collections.abc import Awaitable
-from typing import Callable
+import asyncio
+import functools
 
 from ..dependency import Dependency
-from ..exceptions import CircularDependencyError, InvalidContainerInheritance
-from ..types import CleanupFn, DependencyGraph
+from ..exceptions import CircularDependencyError, DependencyNotResolvedError, InvalidContainerInheritance
+from ..types import AsyncCleanupFn, CleanupFn
 
+_UNSEEN = 0
+_ON_PATH = 1
+_DONE = 2
 
+
+@functools.cache
 def extract_origin_base(cls: type) -> type:
     """Extract first original base class from __orig_bases__."""
     if orig_bases := getattr(cls, "__orig_bases__", None):
@@ -18,6 +22,7 @@ def extract_origin_base(cls: type) -> type:
     raise InvalidContainerInheritance(f"{cls.__name__} missing __orig_bases__, ensure proper generic inheritance")
 
 
+@functools.cache
 def extract_origin(cls: type) -> type:
     """Extract __origin__ from generic type."""
     if origin := getattr(cls, "__origin__", None):
@@ -25,46 +30,73 @@ def extract_origin(cls: type) -> type:
     raise InvalidContainerInheritance(f"{cls} is not a generic type")
 
 
+def _direct_dependencies(dep: Dependency) -> list[str]:
+    """Names of dependencies referenced by a dependency's kwargs."""
+    return [dep_name for _, dep_name in dep._dyn if dep_name]
+
+
 def make_resolution_order(dependencies: dict[str, Dependency]) -> list[str]:
-    """Compute topological sort of dependency graph."""
-    graph: DependencyGraph = {}
-    for name, dep in dependencies.items():
-        deps = set()
-        for value in dep.kwargs.values():
-            if isinstance(value, Dependency) and value.name:
-                deps.add(value.name)
-        graph[name] = deps
-
-    in_degree = {name: len(deps) for name, deps in graph.items()}
-    queue = [name for name, degree in in_degree.items() if degree == 0]
-    queue.sort()
-    ordered_deps = []
-
-    while queue:
-        node = queue.pop(0)
-        ordered_deps.append(node)
-
-        for name, deps in graph.items():
-            if node in deps:
-                in_degree[name] -= 1
-                if in_degree[name] == 0 and name not in ordered_deps:
-                    queue.append(name)
-
-    if len(ordered_deps) != len(graph):
-        pending = [name for name, degree in in_degree.items() if degree > 0]
-        raise CircularDependencyError(f"Circular dependency detected: {pending} (resolved: {ordered_deps})")
+    """Compute resolution order via iterative depth-first post-order."""
+    state = dict.fromkeys(dependencies, _UNSEEN)
+    path: list[str] = []
+    ordered_deps: list[str] = []
+
+    for root in sorted(dependencies):
+        if state[root] != _UNSEEN:
+            continue
+        state[root] = _ON_PATH
+        path.append(root)
+        stack = [(root, iter(_direct_dependencies(dependencies[root])))]
+
+        while stack:
+            name, children = stack[-1]
+            for child in children:
+                if child not in state:
+                    raise DependencyNotResolvedError(f"Dependency '{child}' referenced by '{name}' is not declared in the container")
+                if state[child] == _ON_PATH:
+                    cycle = path[path.index(child) :] + [child]
+                    raise CircularDependencyError(f"Circular dependency detected: {' -> '.join(cycle)}")
+                if state[child] == _UNSEEN:
+                    state[child] = _ON_PATH
+                    path.append(child)
+                    stack.append((child, iter(_direct_dependencies(dependencies[child]))))
+                    break
+            else:
+                state[name] = _DONE
+                path.pop()
+                stack.pop()
+                ordered_deps.append(name)
 
     return ordered_deps
 
 
-def make_cleanup(cleanup_fn: CleanupFn) -> Callable[[], Awaitable[None]]:
-    """Wrap sync or async cleanup function as async."""
-    if inspect.iscoroutinefunction(cleanup_fn):
-        return cleanup_fn
+def make_resolution_levels(dependencies: dict[str, Dependency], resolution_order: list[str]) -> list[list[str]]:
+    """Group dependency names into levels whose members can resolve concurrently."""
+    depth: dict[str, int] = {}
+    levels: list[list[str]] = []
+
+    for name in resolution_order:
+        level = 0
+        for _, dep_name in dependencies[name]._dyn:
+            if dep_name in depth:
+                level = max(level, depth[dep_name] + 1)
+        depth[name] = level
+        if level == len(levels):
+            levels.append([])
+        levels[level].append(name)
 
-    async def _wrapper() -> None:
-        result = cleanup_fn()
-        if inspect.iscoroutine(result):
-            await result
+    return levels
 
-    return _wrapper
+
+async def _run_sync_cleanup(cleanup_fn: CleanupFn) -> None:
+    """Run sync cleanup, awaiting its result if it returned a coroutine."""
+    result = cleanup_fn()
+    if asyncio.iscoroutine(result):
+        await result
+
+
+def make_cleanup(cleanup_fn: CleanupFn) -> AsyncCleanupFn:
+    """Wrap sync or async cleanup function as async."""
+    if asyncio.iscoroutinefunction(cleanup_fn):
+        return cleanup_fn
+    return functools.partial(_run_sync_cleanup, cleanup_fn)
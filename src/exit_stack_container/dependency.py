@@ -2,20 +2,46 @@
 
 from __future__ import annotations
 
-import inspect
-from typing import Any
+import asyncio
+import functools
+import keyword
+from collections.abc import Awaitable
+from typing import Any, Callable
 
+from .defaults import CLEANUP_ATTR_NAME
 from .exceptions import (
     DependencyNotResolvedError,
 )
-from .types import ResolvedDeps, ResourceFactory
+from .types import CleanupGetter, ResolvedDeps, ResourceFactory
+
+
+def _usable_as_kwarg(name: str) -> bool:
+    """Whether a name can appear in generated call source."""
+    return name.isidentifier() and not keyword.iskeyword(name)
+
+
+def _compile_call(static: dict[str, Any], dyn: tuple[tuple[str, str | int | None], ...]) -> Callable[..., Any] | None:
+    """Compile a specialized factory call for a fixed kwarg layout."""
+    if not all(_usable_as_kwarg(key) for key in static):
+        return None
+    if not all(_usable_as_kwarg(key) and dep_key is not None for key, dep_key in dyn):
+        return None
+
+    args = ", ".join(
+        [f"{key}=static[{key!r}]" for key in static] + [f"{key}=resolved[{dep_key!r}]" for key, dep_key in dyn]
+    )
+    namespace: dict[str, Any] = {}
+    exec(compile(f"def _call(factory, resolved, static):\n    return factory({args})\n", "<dependency-call>", "exec"), namespace)
+    return namespace["_call"]
 
 
 class Dependency:
     """Dependency descriptor with factory and kwargs"""
 
+    __slots__ = ("factory", "kwargs", "name", "_static", "_refs", "_dyn", "_async", "_bound", "_call", "_cleanup_getter")
+
     def __init__(self, factory: ResourceFactory, **kwargs: Any) -> None:
-        """Initialize dependency.
+        """Initialize dependency and partition kwargs into static values and references.
 
         Args:
             factory: Factory function creating the resource.
@@ -24,9 +50,59 @@ class Dependency:
         self.factory = factory
         self.kwargs = kwargs
         self.name: str | None = None
+        self._static = {key: value for key, value in kwargs.items() if not isinstance(value, Dependency)}
+        self._refs = tuple((key, value) for key, value in kwargs.items() if isinstance(value, Dependency))
+        self._dyn: tuple[tuple[str, str | None], ...] = ()
+        self._async = asyncio.iscoroutinefunction(factory)
+        self._bound = functools.partial(factory, **self._static) if not self._refs else None
+        self._call: Callable[..., Any] | None = None
+        self._cleanup_getter: CleanupGetter | None = getattr(factory, CLEANUP_ATTR_NAME, None)
 
     def __set_name__(self, owner: type, name: str) -> None:
+        """Bind own name, the names of referenced dependencies, and the specialized call."""
         self.name = name
+        self._dyn = tuple((key, ref.name) for key, ref in self._refs)
+        self._call = _compile_call(self._static, self._dyn) if self._bound is None else None
+        self._cleanup_getter = getattr(self.factory, CLEANUP_ATTR_NAME, None)
+
+    def _make_resolver(self, index: dict[str, int]) -> Callable[[list[Any]], Awaitable[Any]]:
+        """Build a resolver bound to a container's resolution-order positions."""
+        is_async = self._async
+
+        if self._bound is not None:
+            bound = self._bound
+
+            async def _resolve_leaf(resolved: list[Any]) -> Any:
+                result = bound()
+                return await result if is_async else result
+
+            return _resolve_leaf
+
+        dyn_idx: list[tuple[str, int]] = []
+        for key, dep_name in self._dyn:
+            if dep_name not in index:
+                raise DependencyNotResolvedError(f"Dependency '{dep_name}' not resolved for '{self.name}'")
+            dyn_idx.append((key, index[dep_name]))
+
+        factory, static = self.factory, self._static
+        call = _compile_call(static, tuple(dyn_idx))
+
+        if call is not None:
+
+            async def _resolve_compiled(resolved: list[Any]) -> Any:
+                result = call(factory, resolved, static)
+                return await result if is_async else result
+
+            return _resolve_compiled
+
+        async def _resolve_generic(resolved: list[Any]) -> Any:
+            resolved_kwargs = static.copy()
+            for key, position in dyn_idx:
+                resolved_kwargs[key] = resolved[position]
+            result = factory(**resolved_kwargs)
+            return await result if is_async else result
+
+        return _resolve_generic
 
     async def resolve(self, resolved_deps: ResolvedDeps) -> Any:
         """Resolve dependencies and instantiate resource.
@@ -38,17 +114,30 @@ class Dependency:
             Resource instance.
         """
 
-        resolved_kwargs = {}
-        for key, value in self.kwargs.items():
-            if not isinstance(value, Dependency):
-                resolved_kwargs[key] = value
-            else:
-                if value.name not in resolved_deps:
-                    raise DependencyNotResolvedError(f"Dependency '{value.name}' not resolved for '{self.name}'")
-                resolved_kwargs[key] = resolved_deps[value.name]
-        result = self.factory(**resolved_kwargs)
-
-        if inspect.iscoroutine(result):
+        if self._bound is not None:
+            result = self._bound()
+            if self._async:
+                result = await result
+            return result
+
+        if self._call is not None:
+            try:
+                result = self._call(self.factory, resolved_deps, self._static)
+            except KeyError:
+                missing = next((dep_name for _, dep_name in self._dyn if dep_name not in resolved_deps), None)
+                if missing is None:
+                    raise
+                raise DependencyNotResolvedError(f"Dependency '{missing}' not resolved for '{self.name}'") from None
+        else:
+            resolved_kwargs = self._static.copy()
+            for key, dep_name in self._dyn:
+                try:
+                    resolved_kwargs[key] = resolved_deps[dep_name]
+                except KeyError:
+                    raise DependencyNotResolvedError(f"Dependency '{dep_name}' not resolved for '{self.name}'") from None
+            result = self.factory(**resolved_kwargs)
+
+        if self._async:
             result = await result
 
         return result
@@ -2,10 +2,24 @@
 
 from __future__ import annotations
 
+from typing import Any
+
 from msgspec_settings import BaseSettings
 
 
-class BaseResources[T = BaseSettings]:
+class ResourcesMeta(type):
+    """Metaclass deriving __slots__ from resource annotations."""
+
+    def __new__(mcls, name: str, bases: tuple[type, ...], namespace: dict[str, Any], **kwargs: Any) -> type:
+        if "__slots__" not in namespace:
+            inherited = {slot for base in bases for cls in base.__mro__ for slot in cls.__dict__.get("__slots__", ())}
+            namespace["__slots__"] = tuple(
+                field for field in namespace.get("__annotations__", {}) if field not in inherited and field not in namespace
+            )
+        return super().__new__(mcls, name, bases, namespace, **kwargs)
+
+
+class BaseResources[T = BaseSettings](metaclass=ResourcesMeta):
     """Base resource container with settings"""
 
     settings: T
@@ -13,4 +27,5 @@ class BaseResources[T = BaseSettings]:
 
 __all__ = [
     "BaseResources",
+    "ResourcesMeta",
 ]
@@ -7,13 +7,15 @@ from typing import Any, TypeAlias
 
 ResourceFactory: TypeAlias = Callable[..., Any]
 CleanupFn: TypeAlias = Callable[[], None] | Callable[[], Awaitable[None]]
+AsyncCleanupFn: TypeAlias = Callable[[], Awaitable[None]]
 CleanupGetter: TypeAlias = Callable[[Any], CleanupFn]
 ResolvedDeps: TypeAlias = dict[str, Any]
-DependencyGraph: TypeAlias = dict[str, set[str]]
+DependencyGraph: TypeAlias = dict[str, tuple[str, ...]]
 
 __all__ = [
     "ResourceFactory",
     "CleanupFn",
+    "AsyncCleanupFn",
     "CleanupGetter",
     "ResolvedDeps",
     "DependencyGraph",